@@ -1,150 +1,572 @@
 import sqlite3
 import json
-from typing import List, Dict, Optional
+import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Dict, Iterator, Optional
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 from config.settings import settings
 
+logger = logging.getLogger(__name__)
+
+# orjson is a C implementation and much faster than the stdlib for the small
+# JSON blobs stored per question; fall back to json when it isn't installed.
+# Options are stored as UTF-8 JSON bytes (BLOB), so neither direction needs a
+# str round-trip; use CAST(options AS TEXT) to feed them to JSON1 functions.
+try:
+    import orjson
+    
+    def _json_dumps(value) -> bytes:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(value) -> bytes:
+        return json.dumps(value).encode()
+    
+    _json_loads = json.loads
+
+# Per-connection tuning applied to every connection opened by the manager.
+# journal_mode=WAL is persistent in the database file and is set once in
+# init_database; the remaining PRAGMAs only live as long as the connection.
+CONNECTION_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA mmap_size=1073741824;
+    PRAGMA cache_size=-65536;
+    PRAGMA busy_timeout=5000;
+"""
+
+# Number of pooled read connections; under WAL readers never block the writer
+READ_POOL_SIZE = 4
+
+# Size of each connection's prepared statement cache
+CACHED_STATEMENTS = 256
+
+# Seconds the per-type/per-difficulty breakdowns in get_statistics are reused
+# before being recomputed (local writes invalidate them immediately)
+STATS_CACHE_TTL = 30
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time as text in CURRENT_TIMESTAMP format."""
+    return datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
+
+# Schema migrations applied in order by init_database. PRAGMA user_version
+# records how many have run, so an up-to-date database skips them entirely.
+# Each migration must be idempotent: two processes may race on first start.
+SCHEMA_MIGRATIONS = [
+    # 1: questions, processed_files, full-text search and statistics counters
+    '''
+    CREATE TABLE IF NOT EXISTS questions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        question_id TEXT NOT NULL,
+        question_text TEXT NOT NULL,
+        question_type TEXT,
+        options BLOB,  -- JSON-encoded options (UTF-8 bytes)
+        correct_answer TEXT,
+        difficulty_level TEXT,
+        subject_area TEXT,
+        page_number TEXT,
+        source_file TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    
+    -- Track processed files
+    CREATE TABLE IF NOT EXISTS processed_files (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        filename TEXT NOT NULL UNIQUE,
+        file_hash TEXT,
+        questions_count INTEGER DEFAULT 0,
+        processed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        status TEXT DEFAULT 'completed'
+    );
+    
+    -- Per-file lookup (processed_files.filename is already indexed through
+    -- its UNIQUE constraint)
+    CREATE INDEX IF NOT EXISTS idx_questions_source_file
+    ON questions(source_file);
+    
+    -- Keep the per-file question count denormalized on processed_files
+    -- accurate, so readers never need to COUNT/GROUP BY questions
+    CREATE TRIGGER IF NOT EXISTS processed_files_count_delete
+    AFTER DELETE ON questions BEGIN
+        UPDATE processed_files
+        SET questions_count = questions_count - 1
+        WHERE filename = old.source_file AND questions_count > 0;
+    END;
+    
+    -- Full-text index over the searchable columns, kept in sync with the
+    -- questions table by triggers
+    CREATE VIRTUAL TABLE IF NOT EXISTS questions_fts USING fts5(
+        question_text, subject_area,
+        content='questions', content_rowid='id'
+    );
+    
+    CREATE TRIGGER IF NOT EXISTS questions_fts_insert
+    AFTER INSERT ON questions BEGIN
+        INSERT INTO questions_fts (rowid, question_text, subject_area)
+        VALUES (new.id, new.question_text, new.subject_area);
+    END;
+    
+    CREATE TRIGGER IF NOT EXISTS questions_fts_delete
+    AFTER DELETE ON questions BEGIN
+        INSERT INTO questions_fts (questions_fts, rowid, question_text, subject_area)
+        VALUES ('delete', old.id, old.question_text, old.subject_area);
+    END;
+    
+    CREATE TRIGGER IF NOT EXISTS questions_fts_update
+    AFTER UPDATE ON questions BEGIN
+        INSERT INTO questions_fts (questions_fts, rowid, question_text, subject_area)
+        VALUES ('delete', old.id, old.question_text, old.subject_area);
+        INSERT INTO questions_fts (rowid, question_text, subject_area)
+        VALUES (new.id, new.question_text, new.subject_area);
+    END;
+    
+    -- Index questions stored before the full-text table existed
+    INSERT INTO questions_fts (questions_fts) VALUES ('rebuild');
+    
+    -- Pre-computed counters so get_statistics doesn't scan questions
+    CREATE TABLE IF NOT EXISTS stats_cache (
+        key TEXT PRIMARY KEY,
+        value INTEGER NOT NULL DEFAULT 0,
+        updated_at TIMESTAMP
+    );
+    
+    INSERT OR IGNORE INTO stats_cache (key, value, updated_at)
+    SELECT 'total_questions', COUNT(*), CURRENT_TIMESTAMP FROM questions;
+    ''',
+    # 2: indexes matching the read paths' filters, orderings and GROUP BYs
+    '''
+    -- Per-file reads filter on source_file and order by question_id
+    DROP INDEX IF EXISTS idx_questions_source_file;
+    CREATE INDEX IF NOT EXISTS idx_questions_source_file
+    ON questions(source_file, question_id);
+    
+    -- get_all_questions and search tie-breaks order by newest first
+    CREATE INDEX IF NOT EXISTS idx_questions_created_at
+    ON questions(created_at DESC);
+    
+    -- Index-only scans for the get_statistics breakdowns
+    CREATE INDEX IF NOT EXISTS idx_questions_type
+    ON questions(question_type);
+    
+    CREATE INDEX IF NOT EXISTS idx_questions_difficulty
+    ON questions(difficulty_level);
+    ''',
+    # 3: stem search terms so "fractions" also finds "fraction"
+    '''
+    -- The sync triggers resolve questions_fts by name when they fire, so
+    -- they keep working against the recreated table
+    DROP TABLE IF EXISTS questions_fts;
+    CREATE VIRTUAL TABLE questions_fts USING fts5(
+        question_text,
+        subject_area,
+        content='questions',
+        content_rowid='id',
+        tokenize='porter unicode61'
+    );
+    
+    INSERT INTO questions_fts (questions_fts) VALUES ('rebuild');
+    ''',
+    # 4: count inserted questions on processed_files, not only deleted ones
+    '''
+    CREATE TRIGGER IF NOT EXISTS processed_files_count_insert
+    AFTER INSERT ON questions BEGIN
+        UPDATE processed_files
+        SET questions_count = questions_count + 1
+        WHERE filename = new.source_file;
+    END;
+    
+    -- Re-ingesting a file used to overwrite its count with the size of
+    -- the latest batch; recount from the stored rows
+    UPDATE processed_files SET questions_count = (
+        SELECT COUNT(*) FROM questions
+        WHERE questions.source_file = processed_files.filename
+    );
+    ''',
+    # 5: maintain stats_cache.total_questions with triggers, like the
+    # per-file counts, so every write path keeps it accurate
+    '''
+    CREATE TRIGGER IF NOT EXISTS stats_total_insert
+    AFTER INSERT ON questions BEGIN
+        UPDATE stats_cache
+        SET value = value + 1, updated_at = CURRENT_TIMESTAMP
+        WHERE key = 'total_questions';
+    END;
+    
+    CREATE TRIGGER IF NOT EXISTS stats_total_delete
+    AFTER DELETE ON questions BEGIN
+        UPDATE stats_cache
+        SET value = value - 1, updated_at = CURRENT_TIMESTAMP
+        WHERE key = 'total_questions';
+    END;
+    
+    UPDATE stats_cache
+    SET value = (SELECT COUNT(*) FROM questions), updated_at = CURRENT_TIMESTAMP
+    WHERE key = 'total_questions';
+    ''',
+    # 6: processed_at used to be written as local time with microseconds;
+    # convert those values to UTC in CURRENT_TIMESTAMP format, as it is
+    # written now, so files sort by when they were processed
+    '''
+    UPDATE processed_files
+    SET processed_at = datetime(processed_at, 'utc')
+    WHERE processed_at LIKE '%.%';
+    ''',
+]
+
+SCHEMA_VERSION = len(SCHEMA_MIGRATIONS)
+
+# Write-path statements. sqlite3 caches prepared statements per connection,
+# keyed by SQL text, so sharing one string per statement keeps them prepared
+# on the long-lived write connection for the life of the process.
+INSERT_QUESTION_SQL = '''
+    INSERT INTO questions (
+        question_id, question_text, question_type, options,
+        correct_answer, difficulty_level, subject_area,
+        page_number, source_file, created_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Matches only if this exact file content has already been stored and its
+# questions haven't all been deleted since
+SELECT_STORED_FILE_SQL = '''
+    SELECT 1 FROM processed_files
+    WHERE filename = ? AND file_hash = ? AND questions_count > 0
+'''
+
+DELETE_QUESTION_SQL = 'DELETE FROM questions WHERE id = ?'
+
+DELETE_FILE_QUESTIONS_SQL = 'DELETE FROM questions WHERE source_file = ?'
+
+# questions_count is left to the questions triggers, so the file's row must
+# exist before its questions are inserted
+UPSERT_PROCESSED_FILE_SQL = '''
+    INSERT INTO processed_files
+    (filename, file_hash, questions_count, processed_at, status)
+    VALUES (?, ?, 0, ?, ?)
+    ON CONFLICT(filename) DO UPDATE SET
+        file_hash = excluded.file_hash,
+        processed_at = excluded.processed_at,
+        status = excluded.status
+'''
+
+# Read-path statements, shared by all pooled read connections in the same way
+SELECT_ALL_QUESTIONS_SQL = '''
+    SELECT id, question_id, question_text, question_type, options,
+           correct_answer, difficulty_level, subject_area,
+           page_number, source_file, created_at
+    FROM questions ORDER BY created_at DESC
+    LIMIT ? OFFSET ?
+'''
+
+SELECT_QUESTIONS_BY_FILE_SQL = '''
+    SELECT id, question_id, question_text, question_type, options,
+           correct_answer, difficulty_level, subject_area,
+           page_number, source_file, created_at
+    FROM questions WHERE source_file = ? ORDER BY question_id
+'''
+
+SEARCH_QUESTIONS_SQL = '''
+    SELECT q.id, q.question_id, q.question_text, q.question_type, q.options,
+           q.correct_answer, q.difficulty_level, q.subject_area,
+           q.page_number, q.source_file, q.created_at
+    FROM questions_fts
+    JOIN questions q ON q.id = questions_fts.rowid
+    WHERE questions_fts MATCH ?
+    ORDER BY questions_fts.rank, q.created_at DESC
+'''
+
+# Substring matches, for what the full-text index can't match (partial
+# words, bare punctuation). Wildcards in the term are escaped with
+# LIKE_ESCAPES so they match literally.
+SEARCH_QUESTIONS_LIKE_SQL = '''
+    SELECT id, question_id, question_text, question_type, options,
+           correct_answer, difficulty_level, subject_area,
+           page_number, source_file, created_at
+    FROM questions
+    WHERE question_text LIKE ? ESCAPE '\\' OR subject_area LIKE ? ESCAPE '\\'
+    ORDER BY created_at DESC
+'''
+
+LIKE_ESCAPES = str.maketrans({'\\': '\\\\', '%': '\\%', '_': '\\_'})
+
+# get_statistics reads everything it needs in one statement; rows are
+# (group, key, count). The breakdown variant is only issued when the TTL
+# cached copy has expired.
+STATS_TOTALS_SQL = '''
+    SELECT 'total', key, value FROM stats_cache
+    UNION ALL
+    SELECT 'total', 'total_files', COUNT(*) FROM processed_files
+'''
+
+STATS_WITH_BREAKDOWN_SQL = STATS_TOTALS_SQL + '''
+    UNION ALL
+    SELECT 'type', question_type, COUNT(*)
+    FROM questions GROUP BY question_type
+    UNION ALL
+    SELECT 'difficulty', difficulty_level, COUNT(*)
+    FROM questions GROUP BY difficulty_level
+'''
+
+
 class DatabaseManager:
     """Handles database operations for storing parsed questions."""
     
     def __init__(self, db_path: Optional[str] = None):
         """Initialize database manager with database path."""
         self.db_path = db_path or settings.DATABASE_PATH
-        self.init_database()
-    
-    def init_database(self):
-        """Initialize database and create tables if they don't exist."""
+        
         # Ensure directory exists
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
         
-        with sqlite3.connect(self.db_path) as conn:
+        # A single long-lived writer (transactions are managed explicitly)
+        # plus a pool of readers, so page caches and prepared statements
+        # stay warm across calls
+        self._write_lock = threading.Lock()
+        self._write_conn = self._connect()
+        self._write_conn.isolation_level = None
+        
+        # (expires_at, questions_by_type, questions_by_difficulty)
+        self._breakdown_cache = None
+        
+        self.init_database()
+        
+        self._read_pool = queue.Queue()
+        for _ in range(READ_POOL_SIZE):
+            self._read_pool.put(self._connect())
+    
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open a database connection with the performance PRAGMAs applied.
+        
+        Returns:
+            Configured SQLite connection
+        """
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=CACHED_STATEMENTS
+        )
+        conn.executescript(CONNECTION_PRAGMAS)
+        conn.row_factory = sqlite3.Row
+        return conn
+    
+    @contextmanager
+    def _writer(self) -> Iterator[sqlite3.Connection]:
+        """Hold the write lock and yield the shared write connection."""
+        with self._write_lock:
+            try:
+                yield self._write_conn
+            except Exception:
+                if self._write_conn.in_transaction:
+                    self._write_conn.rollback()
+                raise
+    
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read connection from the pool for the duration of a query."""
+        conn = self._read_pool.get()
+        try:
+            yield conn
+        finally:
+            self._read_pool.put(conn)
+    
+    def close(self):
+        """Close the write connection and all pooled read connections."""
+        # Hand back the pages freed by deleted questions before closing
+        self.reclaim_free_pages()
+        
+        with self._write_lock:
+            # Refresh query planner statistics; only tables whose stats are
+            # stale get re-analyzed, so this is cheap
+            self._write_conn.execute('PRAGMA optimize')
+            self._write_conn.close()
+        while not self._read_pool.empty():
+            self._read_pool.get_nowait().close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def init_database(self):
+        """Initialize database and apply any pending schema migrations."""
+        with self._writer() as conn:
             cursor = conn.cursor()
+            cursor.execute('PRAGMA user_version')
+            version = cursor.fetchone()[0]
             
-            # Create questions table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS questions (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    question_id TEXT NOT NULL,
-                    question_text TEXT NOT NULL,
-                    question_type TEXT,
-                    options TEXT,  -- JSON array of options
-                    correct_answer TEXT,
-                    difficulty_level TEXT,
-                    subject_area TEXT,
-                    page_number TEXT,
-                    source_file TEXT,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
+            # Keep free pages reclaimable without a blocking VACUUM; this can
+            # only be chosen before the first table exists and before WAL
+            if version == 0:
+                cursor.execute('SELECT COUNT(*) FROM sqlite_master')
+                if cursor.fetchone()[0] == 0:
+                    cursor.execute('PRAGMA auto_vacuum=INCREMENTAL')
             
-            # Create files table to track processed files
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS processed_files (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    filename TEXT NOT NULL UNIQUE,
-                    file_hash TEXT,
-                    questions_count INTEGER DEFAULT 0,
-                    processed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    status TEXT DEFAULT 'completed'
-                )
-            ''')
+            # Write-ahead logging: readers don't block the writer and commits
+            # append to the WAL instead of rewriting the journal
+            cursor.execute('PRAGMA journal_mode=WAL')
+            
+            cursor.close()
+            
+            # Nothing to do when the schema is already up to date
+            if version >= SCHEMA_VERSION:
+                return
+            
+            # Apply the pending migrations and record the new version in a
+            # single transaction
+            pending = ''.join(SCHEMA_MIGRATIONS[version:])
+            conn.executescript(
+                f"BEGIN IMMEDIATE; {pending} PRAGMA user_version = {SCHEMA_VERSION}; COMMIT;"
+            )
+    
+    def reclaim_free_pages(self, max_pages: int = 1000) -> bool:
+        """
+        Return free pages to the filesystem without a full VACUUM.
+        
+        Runs on close(); long-running callers can also run it periodically.
+        Only has an effect on databases created with incremental auto-vacuum.
+        
+        Args:
+            max_pages: Maximum number of free pages to reclaim
             
-            conn.commit()
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with self._writer() as conn:
+                # executescript steps the PRAGMA to completion; a plain
+                # execute would free a single page
+                conn.executescript(f'PRAGMA incremental_vacuum({int(max_pages)});')
+                return True
+                
+        except Exception:
+            logger.exception("Error reclaiming free pages")
+            return False
     
-    def save_questions(self, questions: List[Dict], source_file: str) -> bool:
+    def save_questions(self, questions: List[Dict], source_file: str,
+                       file_hash: Optional[str] = None,
+                       replace: bool = False) -> bool:
         """
         Save parsed questions to database.
         
         Args:
             questions: List of question dictionaries
             source_file: Name of the source PDF file
+            file_hash: Content hash of the source file; if the same file was
+                already stored with this hash and still has questions, the
+                save is skipped
+            replace: Delete the file's stored questions and save these in
+                their place, even if the hash matches
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            # One timestamp for the whole batch, also used for the
+            # processed_files update
+            created_at = _utc_timestamp()
+            
+            # Build and JSON-encode all rows before taking the write lock, so
+            # the lock is only held for the database work itself
+            rows = []
+            for question in questions:
+                get = question.get  # bind once instead of per field
+                rows.append((
+                    get('question_id', ''),
+                    get('question_text', ''),
+                    get('question_type', ''),
+                    _json_dumps(get('options', [])),
+                    get('correct_answer', ''),
+                    get('difficulty_level', ''),
+                    get('subject_area', ''),
+                    get('page_number', ''),
+                    source_file,
+                    created_at
+                ))
+            
+            with self._writer() as conn:
                 cursor = conn.cursor()
                 
-                for question in questions:
-                    # Convert options list to JSON string
-                    options_json = json.dumps(question.get('options', []))
-                    
-                    cursor.execute('''
-                        INSERT INTO questions (
-                            question_id, question_text, question_type, options,
-                            correct_answer, difficulty_level, subject_area, 
-                            page_number, source_file
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        question.get('question_id', ''),
-                        question.get('question_text', ''),
-                        question.get('question_type', ''),
-                        options_json,
-                        question.get('correct_answer', ''),
-                        question.get('difficulty_level', ''),
-                        question.get('subject_area', ''),
-                        question.get('page_number', ''),
-                        source_file
-                    ))
+                # Re-ingesting an unchanged file would only duplicate its rows
+                if file_hash is not None and not replace:
+                    cursor.execute(SELECT_STORED_FILE_SQL, (source_file, file_hash))
+                    if cursor.fetchone() is not None:
+                        return True
                 
-                # Update processed files table
-                cursor.execute('''
-                    INSERT OR REPLACE INTO processed_files 
-                    (filename, questions_count, processed_at, status)
-                    VALUES (?, ?, ?, ?)
-                ''', (source_file, len(questions), datetime.now(), 'completed'))
+                # Open the transaction explicitly so the processed_files
+                # update and the question rows are flushed in a single commit
+                cursor.execute('BEGIN IMMEDIATE')
+                
+                # Update processed files table in place, keeping its row id;
+                # the insert trigger then adds this batch to its count
+                cursor.execute(
+                    UPSERT_PROCESSED_FILE_SQL,
+                    (source_file, file_hash, created_at, 'completed')
+                )
+                
+                # The questions triggers keep the counts and the full-text
+                # index in step with the removed and inserted rows
+                if replace:
+                    cursor.execute(DELETE_FILE_QUESTIONS_SQL, (source_file,))
+                
+                cursor.executemany(INSERT_QUESTION_SQL, rows)
                 
                 conn.commit()
+                self._breakdown_cache = None
                 return True
                 
-        except Exception as e:
-            print(f"Error saving questions to database: {e}")
+        except Exception:
+            logger.exception("Error saving questions to database")
             return False
     
-    def get_all_questions(self) -> List[Dict]:
+    @staticmethod
+    def _question_from_row(row: sqlite3.Row) -> Dict:
+        """
+        Convert a questions row into a question dictionary.
+        
+        Args:
+            row: Row selected from the questions table
+            
+        Returns:
+            Question dictionary with options decoded from JSON
+        """
+        question = dict(row)
+        question['options'] = _json_loads(row['options']) if row['options'] else []
+        return question
+    
+    def get_all_questions(self, limit: Optional[int] = None,
+                          offset: int = 0) -> List[Dict]:
         """
-        Retrieve all questions from database.
+        Retrieve questions from database, newest first.
         
+        Pass limit and offset to read one page at a time.
+        
+        Args:
+            limit: Maximum number of questions to return (None for all)
+            offset: Number of questions to skip
+            
         Returns:
             List of question dictionaries
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    SELECT id, question_id, question_text, question_type, options,
-                           correct_answer, difficulty_level, subject_area, 
-                           page_number, source_file, created_at
-                    FROM questions ORDER BY created_at DESC
-                ''')
-                
-                rows = cursor.fetchall()
-                questions = []
-                
-                for row in rows:
-                    options = json.loads(row[4]) if row[4] else []
-                    question = {
-                        'id': row[0],
-                        'question_id': row[1],
-                        'question_text': row[2],
-                        'question_type': row[3],
-                        'options': options,
-                        'correct_answer': row[5],
-                        'difficulty_level': row[6],
-                        'subject_area': row[7],
-                        'page_number': row[8],
-                        'source_file': row[9],
-                        'created_at': row[10]
-                    }
-                    questions.append(question)
+            with self._reader() as conn:
+                cursor = conn.execute(
+                    SELECT_ALL_QUESTIONS_SQL,
+                    (-1 if limit is None else limit, offset)
+                )
                 
-                return questions
+                return [self._question_from_row(row) for row in cursor]
                 
-        except Exception as e:
-            print(f"Error retrieving questions: {e}")
+        except Exception:
+            logger.exception("Error retrieving questions")
             return []
     
     def get_questions_by_file(self, source_file: str) -> List[Dict]:
@@ -158,41 +580,38 @@ class DatabaseManager:
             List of question dictionaries
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._reader() as conn:
                 cursor = conn.cursor()
-                cursor.execute('''
-                    SELECT id, question_id, question_text, question_type, options,
-                           correct_answer, difficulty_level, subject_area, 
-                           page_number, source_file, created_at
-                    FROM questions WHERE source_file = ? ORDER BY question_id
-                ''', (source_file,))
-                
-                rows = cursor.fetchall()
-                questions = []
+                cursor.execute(SELECT_QUESTIONS_BY_FILE_SQL, (source_file,))
                 
-                for row in rows:
-                    options = json.loads(row[4]) if row[4] else []
-                    question = {
-                        'id': row[0],
-                        'question_id': row[1],
-                        'question_text': row[2],
-                        'question_type': row[3],
-                        'options': options,
-                        'correct_answer': row[5],
-                        'difficulty_level': row[6],
-                        'subject_area': row[7],
-                        'page_number': row[8],
-                        'source_file': row[9],
-                        'created_at': row[10]
-                    }
-                    questions.append(question)
+                return [self._question_from_row(row) for row in cursor]
                 
-                return questions
-                
-        except Exception as e:
-            print(f"Error retrieving questions by file: {e}")
+        except Exception:
+            logger.exception("Error retrieving questions by file")
             return []
     
+    def is_file_processed(self, filename: str, file_hash: str) -> bool:
+        """
+        Check whether a file with this content has already been saved and
+        still has stored questions.
+        
+        Args:
+            filename: Name of the source PDF file
+            file_hash: Content hash of the source file
+            
+        Returns:
+            True if the file's questions are stored with the same hash,
+            False otherwise
+        """
+        try:
+            with self._reader() as conn:
+                cursor = conn.execute(SELECT_STORED_FILE_SQL, (filename, file_hash))
+                return cursor.fetchone() is not None
+                
+        except Exception:
+            logger.exception("Error checking processed file")
+            return False
+    
     def get_processed_files(self) -> List[Dict]:
         """
         Get list of processed files.
@@ -201,29 +620,17 @@ class DatabaseManager:
             List of processed file information
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._reader() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     SELECT filename, questions_count, processed_at, status
                     FROM processed_files ORDER BY processed_at DESC
                 ''')
                 
-                rows = cursor.fetchall()
-                files = []
-                
-                for row in rows:
-                    file_info = {
-                        'filename': row[0],
-                        'questions_count': row[1],
-                        'processed_at': row[2],
-                        'status': row[3]
-                    }
-                    files.append(file_info)
-                
-                return files
+                return [dict(row) for row in cursor]
                 
-        except Exception as e:
-            print(f"Error retrieving processed files: {e}")
+        except Exception:
+            logger.exception("Error retrieving processed files")
             return []
     
     def delete_question(self, question_id: int) -> bool:
@@ -237,62 +644,55 @@ class DatabaseManager:
             True if successful, False otherwise
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('DELETE FROM questions WHERE id = ?', (question_id,))
-                conn.commit()
+            with self._writer() as conn:
+                # The delete triggers update the counters and the full-text
+                # index within the same statement
+                cursor = conn.execute(DELETE_QUESTION_SQL, (question_id,))
+                
+                self._breakdown_cache = None
                 return cursor.rowcount > 0
                 
-        except Exception as e:
-            print(f"Error deleting question: {e}")
+        except Exception:
+            logger.exception("Error deleting question")
             return False
     
     def search_questions(self, search_term: str) -> List[Dict]:
         """
-        Search questions by text content.
+        Search questions by text content, best matches first.
+        
+        Whole-word (stemmed) matches from the full-text index come first,
+        followed by any other questions containing the term as a substring.
         
         Args:
-            search_term: Term to search for in question text
-            
+            search_term: Term to search for in question text or subject area
+        
         Returns:
             List of matching questions
         """
+        # Quote the term as an FTS5 phrase so punctuation in user input is
+        # not parsed as query syntax
+        match_query = '"' + search_term.replace('"', '""') + '"'
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._reader() as conn:
                 cursor = conn.cursor()
-                cursor.execute('''
-                    SELECT id, question_id, question_text, question_type, options,
-                           correct_answer, difficulty_level, subject_area, 
-                           page_number, source_file, created_at
-                    FROM questions 
-                    WHERE question_text LIKE ? OR subject_area LIKE ?
-                    ORDER BY created_at DESC
-                ''', (f'%{search_term}%', f'%{search_term}%'))
-                
-                rows = cursor.fetchall()
-                questions = []
+                cursor.execute(SEARCH_QUESTIONS_SQL, (match_query,))
+                questions = [self._question_from_row(row) for row in cursor]
+                seen = {question['id'] for question in questions}
                 
-                for row in rows:
-                    options = json.loads(row[4]) if row[4] else []
-                    question = {
-                        'id': row[0],
-                        'question_id': row[1],
-                        'question_text': row[2],
-                        'question_type': row[3],
-                        'options': options,
-                        'correct_answer': row[5],
-                        'difficulty_level': row[6],
-                        'subject_area': row[7],
-                        'page_number': row[8],
-                        'source_file': row[9],
-                        'created_at': row[10]
-                    }
-                    questions.append(question)
+                # The index only matches whole words, so substring matches
+                # are always added to keep results growing as the term
+                # gets shorter
+                pattern = f"%{search_term.translate(LIKE_ESCAPES)}%"
+                cursor.execute(SEARCH_QUESTIONS_LIKE_SQL, (pattern, pattern))
+                questions.extend(
+                    self._question_from_row(row) for row in cursor if row['id'] not in seen
+                )
                 
                 return questions
                 
-        except Exception as e:
-            print(f"Error searching questions: {e}")
+        except Exception:
+            logger.exception("Error searching questions")
             return []
     
     def get_statistics(self) -> Dict:
@@ -303,40 +703,42 @@ class DatabaseManager:
             Dictionary with database statistics
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Total questions
-                cursor.execute('SELECT COUNT(*) FROM questions')
-                total_questions = cursor.fetchone()[0]
-                
-                # Questions by type
-                cursor.execute('''
-                    SELECT question_type, COUNT(*) 
-                    FROM questions 
-                    GROUP BY question_type
-                ''')
-                types_count = dict(cursor.fetchall())
-                
-                # Questions by difficulty
-                cursor.execute('''
-                    SELECT difficulty_level, COUNT(*) 
-                    FROM questions 
-                    GROUP BY difficulty_level
-                ''')
-                difficulty_count = dict(cursor.fetchall())
-                
-                # Total files processed
-                cursor.execute('SELECT COUNT(*) FROM processed_files')
-                total_files = cursor.fetchone()[0]
-                
-                return {
-                    'total_questions': total_questions,
-                    'total_files': total_files,
-                    'questions_by_type': types_count,
-                    'questions_by_difficulty': difficulty_count
-                }
-                
-        except Exception as e:
-            print(f"Error getting statistics: {e}")
+            # Breakdowns are refreshed lazily once the TTL expires
+            breakdown = self._breakdown_cache
+            cached = breakdown is not None and breakdown[0] > time.monotonic()
+            
+            with self._reader() as conn:
+                rows = conn.execute(
+                    STATS_TOTALS_SQL if cached else STATS_WITH_BREAKDOWN_SQL
+                ).fetchall()
+            
+            # Total questions is maintained incrementally on write
+            totals = {}
+            if cached:
+                _, types_count, difficulty_count = breakdown
+            else:
+                types_count, difficulty_count = {}, {}
+            groups = {
+                'total': totals,
+                'type': types_count,
+                'difficulty': difficulty_count
+            }
+            for group, key, count in rows:
+                groups[group][key] = count
+            
+            if not cached:
+                self._breakdown_cache = (
+                    time.monotonic() + STATS_CACHE_TTL, types_count, difficulty_count
+                )
+            
+            # Hand out copies so callers can't modify the cached breakdowns
+            return {
+                'total_questions': totals.get('total_questions', 0),
+                'total_files': totals.get('total_files', 0),
+                'questions_by_type': dict(types_count),
+                'questions_by_difficulty': dict(difficulty_count)
+            }
+            
+        except Exception:
+            logger.exception("Error getting statistics")
             return {}
\ No newline at end of file
@@ -1,9 +1,15 @@
 import google.generativeai as genai
-from typing import List, Dict, Optional
+from typing import List, Dict
 import json
 import re
 from config.settings import settings
 
+# Multiple choice option line such as "A. ..." or "B) ..."
+OPTION_PATTERN = re.compile(r'^[A-D][\.\)]\s*')
+
+# Outermost JSON array in a model response that may wrap it in prose or fences
+JSON_ARRAY_PATTERN = re.compile(r'\[.*\]', re.DOTALL)
+
 class LLMParser:
     """Handles parsing of extracted text using Gemini LLM."""
     
@@ -84,7 +90,7 @@ Return only the JSON array, no additional text.
             response_text = response.text.strip()
             
             # Try to extract JSON from response
-            json_match = re.search(r'\[.*\]', response_text, re.DOTALL)
+            json_match = JSON_ARRAY_PATTERN.search(response_text)
             if json_match:
                 json_text = json_match.group()
                 questions = json.loads(json_text)
@@ -112,12 +118,12 @@ Return only the JSON array, no additional text.
             List of questions found using basic patterns
         """
         questions = []
-        lines = text.split('\n')
+        # Strip every line once; option lines are looked at again as the
+        # lookahead of each question before them
+        lines = [line.strip() for line in text.split('\n')]
         question_id = 1
         
         for i, line in enumerate(lines):
-            line = line.strip()
-            
             # Look for lines ending with question marks
             if line.endswith('?') and len(line) > 10:
                 question = {
@@ -134,10 +140,10 @@ Return only the JSON array, no additional text.
                 # Look for multiple choice options in following lines
                 options = []
                 for j in range(i + 1, min(i + 5, len(lines))):
-                    next_line = lines[j].strip()
-                    if re.match(r'^[A-D][\.\)]\s*', next_line):
+                    next_line = lines[j]
+                    if OPTION_PATTERN.match(next_line):
                         options.append(next_line)
-                    elif next_line and not re.match(r'^[A-D][\.\)]\s*', next_line):
+                    elif next_line:
                         break
                 
                 if options:
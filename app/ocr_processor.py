@@ -1,13 +1,30 @@
 import pytesseract
-from pdf2image import convert_from_path
+from pdf2image import convert_from_path, pdfinfo_from_path
 from PIL import Image
 import cv2
 import numpy as np
 import os
 import tempfile
-from typing import List, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Tuple, Union
 from config.settings import settings
 
+# PyMuPDF renders pages in-process, without spawning pdftoppm or writing
+# page images to disk; pdf2image is used when it isn't installed. Releases
+# before 1.24.3 only provide the fitz module name, which the unrelated
+# "fitz" package on PyPI also uses, so make sure it is PyMuPDF.
+try:
+    import pymupdf as fitz
+except ImportError:
+    try:
+        import fitz
+    except ImportError:
+        fitz = None
+
+if fitz is not None and not (hasattr(fitz, 'open') and hasattr(fitz, 'csGRAY')):
+    fitz = None
+
 class OCRProcessor:
     """Handles OCR processing of PDF files and images."""
     
@@ -16,6 +33,17 @@ class OCRProcessor:
         if settings.TESSERACT_PATH:
             pytesseract.pytesseract.tesseract_cmd = settings.TESSERACT_PATH
         self.language = settings.OCR_LANGUAGE
+        self.dpi = settings.OCR_DPI
+        self.workers = max(settings.OCR_WORKERS, 1)
+        
+        # Tesseract settings are the same for every page, so build the
+        # option string once
+        self.tesseract_config = r'--oem 3 --psm 6 -l ' + self.language
+        
+        # Pages are OCR'd concurrently, so stop each tesseract process from
+        # also spreading across every core
+        if self.workers > 1:
+            os.environ.setdefault('OMP_THREAD_LIMIT', '1')
     
     def preprocess_image(self, image: Image.Image) -> Image.Image:
         """
@@ -27,11 +55,14 @@ class OCRProcessor:
         Returns:
             Preprocessed PIL Image object
         """
-        # Convert PIL image to OpenCV format
-        opencv_image = cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
+        # Pages are rendered in grayscale already; convert anything else
+        # in a single pass rather than going through BGR first
+        if image.mode != 'L':
+            image = image.convert('L')
         
-        # Convert to grayscale
-        gray = cv2.cvtColor(opencv_image, cv2.COLOR_BGR2GRAY)
+        # NumPy reads PIL images through tobytes(), so this still makes one
+        # copy of the pixels; asarray skips the second copy np.array makes
+        gray = np.asarray(image)
         
         # Apply noise reduction
         denoised = cv2.medianBlur(gray, 3)
@@ -59,41 +90,130 @@ class OCRProcessor:
             # Preprocess image
             processed_image = self.preprocess_image(image)
             
-            # Configure OCR settings
-            custom_config = r'--oem 3 --psm 6 -l ' + self.language
+            # pytesseract hands the image to tesseract through a temp file
+            # written in image.format, PNG when unset; uncompressed BMP skips
+            # a zlib encode and decode of every page
+            processed_image.format = 'BMP'
             
             # Extract text
-            text = pytesseract.image_to_string(processed_image, config=custom_config)
+            text = pytesseract.image_to_string(processed_image, config=self.tesseract_config)
             return text.strip()
             
         except Exception as e:
             print(f"Error extracting text from image: {str(e)}")
             return ""
     
-    def pdf_to_text(self, pdf_path: str) -> str:
+    def _render_pages(self, pdf: Union[str, bytes]) -> Iterator[Tuple[int, int, Image.Image]]:
+        """
+        Render PDF pages one at a time, in order, as grayscale images.
+        
+        Args:
+            pdf: Path to the PDF file, or the PDF contents
+            
+        Returns:
+            Iterator of (page number, page count, page image) tuples
+        """
+        if fitz is not None:
+            if isinstance(pdf, bytes):
+                doc = fitz.open(stream=pdf, filetype='pdf')
+            else:
+                doc = fitz.open(pdf)
+            
+            with doc:
+                for page in doc:
+                    pixmap = page.get_pixmap(dpi=self.dpi, colorspace=fitz.csGRAY, alpha=False)
+                    # Wrap the rendered samples as-is instead of copying
+                    # them into a new image buffer
+                    image = Image.frombuffer(
+                        'L', (pixmap.width, pixmap.height), pixmap.samples, 'raw', 'L', 0, 1
+                    )
+                    yield page.number + 1, doc.page_count, image
+            return
+        
+        # Rasterize with parallel pdftoppm workers straight to a scratch
+        # directory, a batch of pages at a time, so OCR of the first pages
+        # overlaps rendering of the rest and only the page being OCR'd is
+        # held in memory
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            if isinstance(pdf, bytes):
+                pdf_path = os.path.join(tmp_dir, 'input.pdf')
+                with open(pdf_path, 'wb') as pdf_file:
+                    pdf_file.write(pdf)
+            else:
+                pdf_path = pdf
+            
+            page_count = pdfinfo_from_path(pdf_path)['Pages']
+            threads = max(settings.PDF_RENDER_THREADS, 1)
+            batch_size = threads * 2
+            
+            for first_page in range(1, page_count + 1, batch_size):
+                page_paths = convert_from_path(
+                    pdf_path,
+                    dpi=self.dpi,
+                    grayscale=True,
+                    first_page=first_page,
+                    last_page=min(first_page + batch_size - 1, page_count),
+                    thread_count=threads,
+                    output_folder=tmp_dir,
+                    paths_only=True
+                )
+                
+                for page_number, page_path in enumerate(page_paths, first_page):
+                    # Decode now, since the page may be OCR'd on another
+                    # thread, and drop the file so scratch space doesn't grow
+                    # with the PDF
+                    image = Image.open(page_path)
+                    image.load()
+                    os.unlink(page_path)
+                    yield page_number, page_count, image
+    
+    def _ocr_pages(self, pdf: Union[str, bytes]) -> Iterator[Tuple[int, str]]:
+        """
+        OCR PDF pages on a thread pool, yielding results in page order.
+        
+        Tesseract runs as a subprocess and OpenCV releases the GIL, so
+        threads keep several cores busy without pickling pages across
+        processes. Rendering runs at most one page per worker ahead of the
+        results being consumed.
+        
+        Args:
+            pdf: Path to the PDF file, or the PDF contents
+            
+        Returns:
+            Iterator of (page number, extracted text) tuples
+        """
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            pending = deque()
+            
+            for page_number, page_count, image in self._render_pages(pdf):
+                print(f"Processing page {page_number} of {page_count}...")
+                pending.append(
+                    (page_number, executor.submit(self.extract_text_from_image, image))
+                )
+                
+                if len(pending) > self.workers:
+                    done_number, future = pending.popleft()
+                    yield done_number, future.result()
+            
+            for done_number, future in pending:
+                yield done_number, future.result()
+    
+    def pdf_to_text(self, pdf_path: Union[str, bytes]) -> str:
         """
         Convert PDF file to text using OCR.
         
         Args:
-            pdf_path: Path to the PDF file
+            pdf_path: Path to the PDF file, or the PDF contents as bytes
             
         Returns:
             Extracted text from all pages
         """
         try:
-            # Convert PDF to images
-            images = convert_from_path(pdf_path, dpi=200)
-            
             extracted_text = []
             
-            for i, image in enumerate(images):
-                print(f"Processing page {i + 1} of {len(images)}...")
-                
-                # Extract text from image
-                page_text = self.extract_text_from_image(image)
-                
+            for page_number, page_text in self._ocr_pages(pdf_path):
                 if page_text:
-                    extracted_text.append(f"--- Page {i + 1} ---\n{page_text}\n")
+                    extracted_text.append(f"--- Page {page_number} ---\n{page_text}\n")
             
             return "\n".join(extracted_text)
             
@@ -112,18 +232,9 @@ class OCRProcessor:
             Extracted text
         """
         try:
-            # Save uploaded file temporarily
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-                tmp_file.write(uploaded_file.getvalue())
-                tmp_path = tmp_file.name
-            
-            # Extract text
-            text = self.pdf_to_text(tmp_path)
-            
-            # Clean up temporary file
-            os.unlink(tmp_path)
-            
-            return text
+            # Render straight from the uploaded bytes; PyMuPDF reads them in
+            # memory, so the upload doesn't have to be written out first
+            return self.pdf_to_text(uploaded_file.getvalue())
             
         except Exception as e:
             print(f"Error processing uploaded file: {str(e)}")
@@ -1,7 +1,9 @@
 import streamlit as st
 import pandas as pd
+import atexit
 from typing import List, Dict
 import json
+import hashlib
 from datetime import datetime
 import io
 
@@ -10,6 +12,54 @@ from app.llm_parser import LLMParser
 from app.database_manager import DatabaseManager
 from config.settings import settings
 
+# Question fields shown in the questions table, with their column headers
+QUESTION_TABLE_COLUMNS = {
+    'id': 'ID',
+    'question_text': 'Question',
+    'question_type': 'Type',
+    'subject_area': 'Subject',
+    'difficulty_level': 'Difficulty',
+    'source_file': 'Source',
+    'created_at': 'Created'
+}
+
+# Questions per page when browsing all stored questions
+QUESTIONS_PAGE_SIZE = 50
+
+@st.cache_resource
+def get_database_manager() -> DatabaseManager:
+    """Return the process-wide database manager, reused across reruns and sessions."""
+    db_manager = DatabaseManager()
+    # The manager lives as long as the server process, so close it (which
+    # reclaims free pages and runs PRAGMA optimize) when the process exits
+    atexit.register(db_manager.close)
+    return db_manager
+
+@st.cache_resource
+def get_ocr_processor() -> OCRProcessor:
+    """Return the process-wide OCR processor, reused across reruns and sessions."""
+    return OCRProcessor()
+
+@st.cache_resource
+def get_llm_parser() -> LLMParser:
+    """Return the process-wide Gemini parser, reused across reruns and sessions."""
+    return LLMParser()
+
+@st.cache_data
+def get_processed_filenames() -> List[str]:
+    """Return processed file names for the file filter, cached until cleared."""
+    return [f['filename'] for f in get_database_manager().get_processed_files()]
+
+@st.cache_data
+def get_file_questions(source_file: str) -> List[Dict]:
+    """Return one processed file's questions, cached until cleared."""
+    return get_database_manager().get_questions_by_file(source_file)
+
+def clear_question_caches():
+    """Drop cached file lists and per-file questions after the data changes."""
+    get_processed_filenames.clear()
+    get_file_questions.clear()
+
 class StreamlitUI:
     """Streamlit-based user interface for the OCR application."""
     
@@ -17,7 +67,7 @@ class StreamlitUI:
         """Initialize UI components."""
         self.ocr_processor = None
         self.llm_parser = None
-        self.db_manager = DatabaseManager()
+        self.db_manager = get_database_manager()
         
         # Initialize session state
         if 'processing_complete' not in st.session_state:
@@ -40,13 +90,13 @@ class StreamlitUI:
         """Initialize OCR and LLM components with error handling."""
         try:
             if self.ocr_processor is None:
-                self.ocr_processor = OCRProcessor()
+                self.ocr_processor = get_ocr_processor()
             
             if self.llm_parser is None:
                 if not settings.GEMINI_API_KEY:
                     st.error("❌ Gemini API key is not configured. Please add it to your .env file.")
                     st.stop()
-                self.llm_parser = LLMParser()
+                self.llm_parser = get_llm_parser()
             
             return True
             
@@ -91,7 +141,7 @@ class StreamlitUI:
             st.info(f"File size: {uploaded_file.size / 1024 / 1024:.2f} MB")
             
             # Processing options
-            col1, col2 = st.columns(2)
+            col1, col2, col3 = st.columns(3)
             
             with col1:
                 enhance_metadata = st.checkbox(
@@ -107,11 +157,20 @@ class StreamlitUI:
                     help="Store extracted questions in the database"
                 )
             
+            with col3:
+                reprocess = st.checkbox(
+                    "Reprocess",
+                    value=False,
+                    help="Run OCR and parsing again even if this file was already "
+                         "processed, replacing its saved questions"
+                )
+            
             # Process button
             if st.button("🚀 Process PDF", type="primary", use_container_width=True):
-                self.process_pdf(uploaded_file, enhance_metadata, save_to_db)
+                self.process_pdf(uploaded_file, enhance_metadata, save_to_db, reprocess)
     
-    def process_pdf(self, uploaded_file, enhance_metadata: bool, save_to_db: bool):
+    def process_pdf(self, uploaded_file, enhance_metadata: bool, save_to_db: bool,
+                    reprocess: bool = False):
         """Process the uploaded PDF file."""
         if not self.initialize_components():
             return
@@ -120,6 +179,22 @@ class StreamlitUI:
         status_text = st.empty()
         
         try:
+            file_hash = hashlib.sha256(uploaded_file.getvalue()).hexdigest()
+            
+            # An unchanged file that is already stored would be OCR'd and
+            # parsed again only for save_questions to skip it
+            if (save_to_db and not reprocess
+                    and self.db_manager.is_file_processed(uploaded_file.name, file_hash)):
+                parsed_questions = self.db_manager.get_questions_by_file(uploaded_file.name)
+                st.session_state.parsed_questions = parsed_questions
+                
+                progress_bar.progress(100)
+                status_text.text("✅ File already processed, loaded saved questions")
+                st.session_state.processing_complete = True
+                
+                self.display_processing_results(parsed_questions, "")
+                return
+            
             # Step 1: OCR Processing
             status_text.text("🔍 Extracting text from PDF...")
             progress_bar.progress(20)
@@ -164,10 +239,13 @@ class StreamlitUI:
             if save_to_db:
                 status_text.text("💾 Saving to database...")
                 progress_bar.progress(90)
-                success = self.db_manager.save_questions(parsed_questions, uploaded_file.name)
+                success = self.db_manager.save_questions(
+                    parsed_questions, uploaded_file.name, file_hash, replace=reprocess
+                )
                 if not success:
                     st.error("❌ Failed to save questions to database.")
                     return
+                clear_question_caches()
             
             # Complete
             progress_bar.progress(100)
@@ -187,8 +265,9 @@ class StreamlitUI:
         st.success(f"🎉 Successfully extracted {len(questions)} questions!")
         
         # Display extracted text (collapsible)
-        with st.expander("📝 View Extracted Text"):
-            st.text_area("Raw OCR Text", extracted_text, height=200)
+        if extracted_text:
+            with st.expander("📝 View Extracted Text"):
+                st.text_area("Raw OCR Text", extracted_text, height=200)
         
         # Display parsed questions
         st.subheader("📋 Parsed Questions")
@@ -207,8 +286,8 @@ class StreamlitUI:
                     st.write(f"**Page:** {question.get('page_number', 'Unknown')}")
                     if question.get('options'):
                         st.write("**Options:**")
-                        for option in question['options']:
-                            st.write(f"  • {option}")
+                        # One element for all options instead of one per line
+                        st.write("  \n".join(f"• {option}" for option in question['options']))
         
         # Download options
         self.render_download_options(questions)
@@ -217,6 +296,9 @@ class StreamlitUI:
         """Render download options for processed questions."""
         st.subheader("📥 Download Options")
         
+        # One timestamp so all formats of this export share a file name
+        file_stem = f"questions_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        
         col1, col2, col3 = st.columns(3)
         
         with col1:
@@ -225,7 +307,7 @@ class StreamlitUI:
             st.download_button(
                 label="📄 Download JSON",
                 data=json_data,
-                file_name=f"questions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                file_name=f"{file_stem}.json",
                 mime="application/json"
             )
         
@@ -237,7 +319,7 @@ class StreamlitUI:
                 st.download_button(
                     label="📊 Download CSV",
                     data=csv_data,
-                    file_name=f"questions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                    file_name=f"{file_stem}.csv",
                     mime="text/csv"
                 )
         
@@ -251,7 +333,7 @@ class StreamlitUI:
                 st.download_button(
                     label="📈 Download Excel",
                     data=excel_data,
-                    file_name=f"questions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+                    file_name=f"{file_stem}.xlsx",
                     mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
                 )
     
@@ -263,44 +345,52 @@ class StreamlitUI:
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            search_term = st.text_input("🔍 Search questions", "")
-        
-        with col2:
-            files = [f['filename'] for f in self.db_manager.get_processed_files()]
-            selected_file = st.selectbox("📁 Filter by file", ["All files"] + files)
+            search_term = st.text_input("🔍 Search questions", "").strip()
         
         with col3:
             refresh_btn = st.button("🔄 Refresh", use_container_width=True)
         
+        # File lists and per-file questions are cached; refresh picks up
+        # changes made elsewhere
+        if refresh_btn:
+            clear_question_caches()
+        
+        with col2:
+            files = get_processed_filenames()
+            selected_file = st.selectbox("📁 Filter by file", ["All files"] + files)
+        
         # Get questions based on filters
         if search_term:
             questions = self.db_manager.search_questions(search_term)
+            total = len(questions)
         elif selected_file != "All files":
-            questions = self.db_manager.get_questions_by_file(selected_file)
+            questions = get_file_questions(selected_file)
+            total = len(questions)
         else:
-            questions = self.db_manager.get_all_questions()
+            # Unfiltered, the table is read one page at a time; the total
+            # comes from the maintained counter rather than a COUNT(*)
+            total = self.db_manager.get_statistics().get('total_questions', 0)
+            page_count = max((total + QUESTIONS_PAGE_SIZE - 1) // QUESTIONS_PAGE_SIZE, 1)
+            page = st.number_input(
+                f"Page (of {page_count})", min_value=1, max_value=page_count, value=1, step=1
+            )
+            questions = self.db_manager.get_all_questions(
+                limit=QUESTIONS_PAGE_SIZE, offset=(page - 1) * QUESTIONS_PAGE_SIZE
+            )
         
         if not questions:
             st.info("📭 No questions found. Upload and process some PDF files first!")
             return
         
         # Display questions in a table
-        st.subheader(f"Found {len(questions)} questions")
-        
-        # Convert to DataFrame for better display
-        df_data = []
-        for q in questions:
-            df_data.append({
-                'ID': q['id'],
-                'Question': q['question_text'][:100] + '...' if len(q['question_text']) > 100 else q['question_text'],
-                'Type': q['question_type'],
-                'Subject': q['subject_area'],
-                'Difficulty': q['difficulty_level'],
-                'Source': q['source_file'],
-                'Created': q['created_at']
-            })
-        
-        df = pd.DataFrame(df_data)
+        st.subheader(f"Found {total} questions")
+        
+        # Convert to DataFrame for better display; columns are picked and
+        # the question text truncated in pandas rather than row by row
+        df = pd.DataFrame.from_records(questions, columns=list(QUESTION_TABLE_COLUMNS))
+        text = df['question_text']
+        df['question_text'] = text.where(text.str.len() <= 100, text.str[:100] + '...')
+        df = df.rename(columns=QUESTION_TABLE_COLUMNS)
         st.dataframe(df, use_container_width=True, hide_index=True)
     
     def render_statistics_page(self):
@@ -0,0 +1,38 @@
+import atexit
+import logging
+import logging.handlers
+import queue
+from pathlib import Path
+from config.settings import settings
+
+_listener = None
+
+def setup_logging():
+    """
+    Route application logging through a queue so callers never block on I/O.
+    
+    Log records are handed to a QueueHandler; a background QueueListener
+    writes them to LOG_FILE and stderr. Safe to call more than once.
+    """
+    global _listener
+    if _listener is not None:
+        return
+    
+    formatter = logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s')
+    
+    # Ensure log directory exists
+    Path(settings.LOG_FILE).parent.mkdir(parents=True, exist_ok=True)
+    file_handler = logging.FileHandler(settings.LOG_FILE)
+    file_handler.setFormatter(formatter)
+    
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+    
+    log_queue = queue.Queue(-1)
+    _listener = logging.handlers.QueueListener(log_queue, file_handler, stream_handler)
+    _listener.start()
+    atexit.register(_listener.stop)
+    
+    root_logger = logging.getLogger()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    root_logger.setLevel(logging.DEBUG if settings.DEBUG_MODE else logging.INFO)
@@ -20,12 +20,18 @@ class Settings:
     # OCR Configuration
     TESSERACT_PATH = os.getenv('TESSERACT_PATH', '/usr/bin/tesseract')
     OCR_LANGUAGE = os.getenv('OCR_LANGUAGE', 'eng')
+    OCR_DPI = int(os.getenv('OCR_DPI', '200'))
+    PDF_RENDER_THREADS = int(os.getenv('PDF_RENDER_THREADS', str(min(os.cpu_count() or 1, 8))))
+    OCR_WORKERS = int(os.getenv('OCR_WORKERS', str(min(os.cpu_count() or 1, 4))))
     
     # Application Configuration
     APP_TITLE = os.getenv('APP_TITLE', 'PDF Question Parser')
     APP_PORT = int(os.getenv('APP_PORT', '8501'))
     DEBUG_MODE = os.getenv('DEBUG_MODE', 'False').lower() == 'true'
     
+    # Logging Configuration
+    LOG_FILE = os.getenv('LOG_FILE', './data/app.log')
+    
     # File Upload Configuration
     MAX_FILE_SIZE_MB = int(os.getenv('MAX_FILE_SIZE_MB', '10'))
     ALLOWED_EXTENSIONS = os.getenv('ALLOWED_EXTENSIONS', 'pdf').split(',')
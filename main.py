@@ -14,7 +14,6 @@ or
 """
 
 import sys
-import os
 from pathlib import Path
 
 # Add the current directory to the Python path
@@ -23,12 +22,14 @@ sys.path.insert(0, str(current_dir))
 
 try:
     from config.settings import settings
+    from config.logging_config import setup_logging
     from app.streamlit_ui import main
     
     if __name__ == "__main__":
         # Validate settings before starting
         try:
             settings.validate_settings()
+            setup_logging()
             print(f"✅ Starting {settings.APP_TITLE}...")
             print(f"🌐 Access the application at: http://localhost:{settings.APP_PORT}")
             
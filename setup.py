@@ -5,7 +5,6 @@ Setup script for PDF Question Parser application.
 
 import subprocess
 import sys
-import os
 from pathlib import Path
 
 def install_requirements():